@@ -548,23 +548,18 @@ PyDoc_STRVAR(gpiod_Line_get_value_doc,
 static PyObject *gpiod_Line_get_value(gpiod_LineObject *self,
 				      PyObject *Py_UNUSED(ignored))
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *vals, *ret;
-
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
-		return NULL;
+	int rv;
 
-	vals = PyObject_CallMethod((PyObject *)bulk_obj, "get_values", "");
-	Py_DECREF(bulk_obj);
-	if (!vals)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	ret = PyList_GetItem(vals, 0);
-	Py_INCREF(ret);
-	Py_DECREF(vals);
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_get_value(self->line);
+	Py_END_ALLOW_THREADS;
+	if (rv < 0)
+		return PyErr_SetFromErrno(PyExc_OSError);
 
-	return ret;
+	return PyLong_FromLong(rv);
 }
 
 PyDoc_STRVAR(gpiod_Line_set_value_doc,
@@ -577,30 +572,22 @@ PyDoc_STRVAR(gpiod_Line_set_value_doc,
 
 static PyObject *gpiod_Line_set_value(gpiod_LineObject *self, PyObject *args)
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *val, *vals, *ret;
-	int rv;
+	int rv, val;
 
-	rv = PyArg_ParseTuple(args, "O", &val);
-	if (!rv)
-		return NULL;
-
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	vals = Py_BuildValue("(O)", val);
-	if (!vals) {
-		Py_DECREF(bulk_obj);
+	rv = PyArg_ParseTuple(args, "i", &val);
+	if (!rv)
 		return NULL;
-	}
 
-	ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				  "set_values", "(O)", vals);
-	Py_DECREF(bulk_obj);
-	Py_DECREF(vals);
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_set_value(self->line, val);
+	Py_END_ALLOW_THREADS;
+	if (rv)
+		return PyErr_SetFromErrno(PyExc_OSError);
 
-	return ret;
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_set_config_doc,
@@ -617,36 +604,23 @@ PyDoc_STRVAR(gpiod_Line_set_config_doc,
 
 static PyObject *gpiod_Line_set_config(gpiod_LineObject *self, PyObject *args)
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *dirn, *flags, *val, *vals, *ret;
-	int rv;
+	int rv, dirn, flags, val;
 
-	val = NULL;
-	rv = PyArg_ParseTuple(args, "OO|O", &dirn, &flags, &val);
-	if (!rv)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	val = 0;
+	rv = PyArg_ParseTuple(args, "ii|i", &dirn, &flags, &val);
+	if (!rv)
 		return NULL;
 
-	if (val) {
-		vals = Py_BuildValue("(O)", val);
-		if (!vals) {
-			Py_DECREF(bulk_obj);
-			return NULL;
-		}
-		ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				"set_config", "OO(O)", dirn, flags, vals);
-		Py_DECREF(vals);
-	} else {
-		ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				"set_config", "OO", dirn, flags);
-	}
-
-	Py_DECREF(bulk_obj);
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_set_config(self->line, dirn, flags, val);
+	Py_END_ALLOW_THREADS;
+	if (rv)
+		return PyErr_SetFromErrno(PyExc_OSError);
 
-	return ret;
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_set_flags_doc,
@@ -659,18 +633,22 @@ PyDoc_STRVAR(gpiod_Line_set_flags_doc,
 
 static PyObject *gpiod_Line_set_flags(gpiod_LineObject *self, PyObject *args)
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *ret;
+	int rv, flags;
 
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				  "set_flags", "O", args);
-	Py_DECREF(bulk_obj);
+	rv = PyArg_ParseTuple(args, "i", &flags);
+	if (!rv)
+		return NULL;
 
-	return ret;
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_set_flags(self->line, flags);
+	Py_END_ALLOW_THREADS;
+	if (rv)
+		return PyErr_SetFromErrno(PyExc_OSError);
+
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_set_direction_input_doc,
@@ -681,18 +659,18 @@ PyDoc_STRVAR(gpiod_Line_set_direction_input_doc,
 static PyObject *gpiod_Line_set_direction_input(gpiod_LineObject *self,
 						PyObject *Py_UNUSED(ignored))
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *ret;
+	int rv;
 
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				  "set_direction_input", "");
-	Py_DECREF(bulk_obj);
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_set_direction_input(self->line);
+	Py_END_ALLOW_THREADS;
+	if (rv)
+		return PyErr_SetFromErrno(PyExc_OSError);
 
-	return ret;
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_set_direction_output_doc,
@@ -706,37 +684,23 @@ PyDoc_STRVAR(gpiod_Line_set_direction_output_doc,
 static PyObject *gpiod_Line_set_direction_output(gpiod_LineObject *self,
 						 PyObject *args)
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *val, *vals, *ret;
-	int rv;
-	const char *fmt;
-
-	val = NULL;
-	rv = PyArg_ParseTuple(args, "|O", &val);
-	if (!rv)
-		return NULL;
+	int rv, val;
 
-	if (val) {
-		fmt = "(O)";
-		vals = Py_BuildValue(fmt, val);
-	} else {
-		vals = Py_BuildValue("()");
-		fmt = "O"; /* pass empty args to bulk */
-	}
-	if (!vals)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	val = 0;
+	rv = PyArg_ParseTuple(args, "|i", &val);
+	if (!rv)
 		return NULL;
 
-	ret = PyObject_CallMethod((PyObject *)bulk_obj,
-				  "set_direction_output", fmt, vals);
-
-	Py_DECREF(bulk_obj);
-	Py_DECREF(vals);
+	Py_BEGIN_ALLOW_THREADS;
+	rv = gpiod_line_set_direction_output(self->line, val);
+	Py_END_ALLOW_THREADS;
+	if (rv)
+		return PyErr_SetFromErrno(PyExc_OSError);
 
-	return ret;
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_release_doc,
@@ -747,17 +711,12 @@ PyDoc_STRVAR(gpiod_Line_release_doc,
 static PyObject *gpiod_Line_release(gpiod_LineObject *self,
 				    PyObject *Py_UNUSED(ignored))
 {
-	gpiod_LineBulkObject *bulk_obj;
-	PyObject *ret;
-
-	bulk_obj = gpiod_LineToLineBulk(self);
-	if (!bulk_obj)
+	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	ret = PyObject_CallMethod((PyObject *)bulk_obj, "release", "");
-	Py_DECREF(bulk_obj);
+	gpiod_line_release(self->line);
 
-	return ret;
+	Py_RETURN_NONE;
 }
 
 PyDoc_STRVAR(gpiod_Line_update_doc,
@@ -770,7 +729,9 @@ static PyObject *gpiod_Line_update(gpiod_LineObject *self,
 {
 	int ret;
 
+	Py_BEGIN_ALLOW_THREADS;
 	ret = gpiod_line_update(self->line);
+	Py_END_ALLOW_THREADS;
 	if (ret)
 		return PyErr_SetFromErrno(PyExc_OSError);
 
@@ -925,23 +886,17 @@ static PyObject *gpiod_Line_event_get_fd(gpiod_LineObject *self,
 
 static PyObject *gpiod_Line_repr(gpiod_LineObject *self)
 {
-	PyObject *chip_name, *ret;
 	const char *line_name;
 
 	if (gpiod_ChipIsClosed(self->owner))
 		return NULL;
 
-	chip_name = PyObject_CallMethod((PyObject *)self->owner, "name", "");
-	if (!chip_name)
-		return NULL;
-
 	line_name = gpiod_line_name(self->line);
 
-	ret = PyUnicode_FromFormat("'%S:%u /%s/'", chip_name,
-				   gpiod_line_offset(self->line),
-				   line_name ?: "unnamed");
-	Py_DECREF(chip_name);
-	return ret;
+	return PyUnicode_FromFormat("'%s:%u /%s/'",
+				    gpiod_chip_name(self->owner->chip),
+				    gpiod_line_offset(self->line),
+				    line_name ?: "unnamed");
 }
 
 static PyMethodDef gpiod_Line_methods[] = {
@@ -1217,6 +1172,29 @@ static PyObject *gpiod_LineBulk_iternext(gpiod_LineBulkObject *self)
 	return self->lines[self->iter_idx++];
 }
 
+static Py_ssize_t gpiod_LineBulk_length(gpiod_LineBulkObject *self)
+{
+	return self->num_lines;
+}
+
+static PyObject *gpiod_LineBulk_item(gpiod_LineBulkObject *self,
+				     Py_ssize_t idx)
+{
+	if (idx < 0 || idx >= self->num_lines) {
+		PyErr_SetString(PyExc_IndexError,
+				"LineBulk index out of range");
+		return NULL;
+	}
+
+	Py_INCREF(self->lines[idx]);
+	return self->lines[idx];
+}
+
+static PySequenceMethods gpiod_LineBulk_sequence_methods = {
+	.sq_length = (lenfunc)gpiod_LineBulk_length,
+	.sq_item = (ssizeargfunc)gpiod_LineBulk_item,
+};
+
 PyDoc_STRVAR(gpiod_LineBulk_to_list_doc,
 "to_list() -> list of gpiod.Line objects\n"
 "\n"
@@ -1420,18 +1398,13 @@ static PyObject *gpiod_LineBulk_get_values(gpiod_LineBulkObject *self,
 		return NULL;
 
 	for (i = 0; i < self->num_lines; i++) {
-		val = Py_BuildValue("i", vals[i]);
+		val = PyLong_FromLong(vals[i]);
 		if (!val) {
 			Py_DECREF(val_list);
 			return NULL;
 		}
 
-		rv = PyList_SetItem(val_list, i, val);
-		if (rv < 0) {
-			Py_DECREF(val);
-			Py_DECREF(val_list);
-			return NULL;
-		}
+		PyList_SET_ITEM(val_list, i, val);
 	}
 
 	return val_list;
@@ -1772,7 +1745,7 @@ static PyObject *gpiod_LineBulk_event_wait(gpiod_LineBulkObject *self,
 
 static PyObject *gpiod_LineBulk_repr(gpiod_LineBulkObject *self)
 {
-	PyObject *list, *list_repr, *chip_name, *ret;
+	PyObject *list, *list_repr, *ret;
 	gpiod_LineObject *line;
 
 	if (gpiod_LineBulkOwnerIsClosed(self))
@@ -1788,14 +1761,8 @@ static PyObject *gpiod_LineBulk_repr(gpiod_LineBulkObject *self)
 		return NULL;
 
 	line = (gpiod_LineObject *)self->lines[0];
-	chip_name = PyObject_CallMethod((PyObject *)line->owner, "name", "");
-	if (!chip_name) {
-		Py_DECREF(list_repr);
-		return NULL;
-	}
-
-	ret = PyUnicode_FromFormat("%U%U", chip_name, list_repr);
-	Py_DECREF(chip_name);
+	ret = PyUnicode_FromFormat("%s%U",
+				   gpiod_chip_name(line->owner->chip), list_repr);
 	Py_DECREF(list_repr);
 	return ret;
 }
@@ -1869,12 +1836,12 @@ PyDoc_STRVAR(gpiod_LineBulkType_doc,
 "\n"
 "Objects of this type are immutable. The constructor takes as argument\n"
 "a sequence of gpiod.Line objects. It doesn't accept objects of any other\n"
-"type.");
+"type. The lines can be accessed by index and len() returns their number.");
 
 static PyTypeObject gpiod_LineBulkType = {
 	PyVarObject_HEAD_INIT(NULL, 0)
 	.tp_name = "gpiod.LineBulk",
-	.tp_basicsize = sizeof(gpiod_LineBulkType),
+	.tp_basicsize = sizeof(gpiod_LineBulkObject),
 	.tp_flags = Py_TPFLAGS_DEFAULT,
 	.tp_doc = gpiod_LineBulkType_doc,
 	.tp_new = PyType_GenericNew,
@@ -1883,6 +1850,7 @@ static PyTypeObject gpiod_LineBulkType = {
 	.tp_iter = PyObject_SelfIter,
 	.tp_iternext = (iternextfunc)gpiod_LineBulk_iternext,
 	.tp_repr = (reprfunc)gpiod_LineBulk_repr,
+	.tp_as_sequence = &gpiod_LineBulk_sequence_methods,
 	.tp_methods = gpiod_LineBulk_methods,
 };
 
@@ -2252,7 +2220,9 @@ gpiod_Chip_get_all_lines(gpiod_ChipObject *self, PyObject *Py_UNUSED(ignored))
 	if (gpiod_ChipIsClosed(self))
 		return NULL;
 
+	Py_BEGIN_ALLOW_THREADS;
 	rv = gpiod_chip_get_all_lines(self->chip, &bulk);
+	Py_END_ALLOW_THREADS;
 	if (rv)
 		return (gpiod_LineBulkObject *)PyErr_SetFromErrno(
 							PyExc_OSError);
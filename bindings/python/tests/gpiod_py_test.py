@@ -11,15 +11,39 @@ import errno
 import gpiod
 import gpiomockup
 import os
+import re
 import select
 import time
 import threading
 import unittest
 
-from packaging import version
-
 mockup = None
+mockup_config = None
 default_consumer = 'gpiod-py-test'
+kernel_version_regex = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?')
+
+def mockup_probe(chip_sizes, flags, reuse=False):
+    global mockup_config
+
+    config = ( tuple(chip_sizes), flags )
+    if mockup_config is not None:
+        if reuse and mockup_config == config:
+            return
+
+        mockup_remove()
+
+    mockup.probe(chip_sizes, flags=flags)
+    mockup_config = config
+
+def mockup_remove():
+    global mockup_config
+
+    if mockup_config is not None:
+        mockup.remove()
+        mockup_config = None
+
+def tearDownModule():
+    mockup_remove()
 
 class MockupTestCase(unittest.TestCase):
 
@@ -27,10 +51,26 @@ class MockupTestCase(unittest.TestCase):
     flags = 0
 
     def setUp(self):
-        mockup.probe(self.chip_sizes, flags=self.flags)
+        mockup_probe(self.chip_sizes, self.flags)
 
     def tearDown(self):
-        mockup.remove()
+        mockup_remove()
+
+class SharedMockupTestCase(MockupTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # The mockup is left in place after the class is done and reused
+        # by the next shared test case if it needs the same chips.
+        mockup_probe(cls.chip_sizes, cls.flags, reuse=True)
+
+    def setUp(self):
+        for chip_idx, num_lines in enumerate(self.chip_sizes):
+            mockup.chip_set_pulls(chip_idx, range(num_lines),
+                                  ( 0, ) * num_lines)
+
+    def tearDown(self):
+        pass
 
 class EventThread(threading.Thread):
 
@@ -39,26 +79,19 @@ class EventThread(threading.Thread):
         self.chip_idx = chip_idx
         self.line_offset = line_offset
         self.freq = freq
-        self.lock = threading.Lock()
-        self.cond = threading.Condition(self.lock)
-        self.should_stop = False
+        self.period = float(freq) / 1000
+        self.stop_event = threading.Event()
 
     def run(self):
-        i = 0;
-        while True:
-            with self.lock:
-                if self.should_stop:
-                    break;
-
-                if not self.cond.wait(float(self.freq) / 1000):
-                    mockup.chip_set_pull(self.chip_idx,
-                                         self.line_offset, i % 2)
-                    i += 1
+        val = 1
+        deadline = time.monotonic()
+        while not self.stop_event.wait(max(0, deadline - time.monotonic())):
+            mockup.chip_set_pull(self.chip_idx, self.line_offset, val)
+            val ^= 1
+            deadline += self.period
 
     def stop(self):
-        with self.lock:
-            self.should_stop = True
-            self.cond.notify_all()
+        self.stop_event.set()
 
     def __enter__(self):
         self.start()
@@ -71,7 +104,9 @@ class EventThread(threading.Thread):
 def check_kernel(major, minor, release):
     current = os.uname().release.split('-')[0]
     required = '{}.{}.{}'.format(major, minor, release)
-    if version.parse(current) < version.parse(required):
+    match = kernel_version_regex.match(current)
+    found = tuple(int(num or 0) for num in match.groups()) if match else ()
+    if found < (major, minor, release):
         raise NotImplementedError(
                 'linux kernel version must be at least {} - got {}'.format(required, current))
 
@@ -79,7 +114,7 @@ def check_kernel(major, minor, release):
 # Chip test cases
 #
 
-class ChipOpen(MockupTestCase):
+class ChipOpen(SharedMockupTestCase):
 
     chip_sizes = ( 8, 8, 8 )
 
@@ -92,7 +127,7 @@ class ChipOpen(MockupTestCase):
             self.assertEqual(chip.name(), mockup.chip_name(1))
 
     def test_open_chip_by_num(self):
-        with gpiod.Chip('{}'.format(mockup.chip_num(1)),
+        with gpiod.Chip(str(mockup.chip_num(1)),
                         gpiod.Chip.OPEN_BY_NUMBER) as chip:
             self.assertEqual(chip.name(), mockup.chip_name(1))
 
@@ -109,7 +144,7 @@ class ChipOpen(MockupTestCase):
             self.assertEqual(chip.name(), mockup.chip_name(1))
 
     def test_lookup_chip_by_num(self):
-        with gpiod.Chip('{}'.format(mockup.chip_num(1))) as chip:
+        with gpiod.Chip(str(mockup.chip_num(1))) as chip:
             self.assertEqual(chip.name(), mockup.chip_name(1))
 
     def test_lookup_chip_by_label(self):
@@ -124,7 +159,7 @@ class ChipOpen(MockupTestCase):
         with self.assertRaises(TypeError):
             chip = gpiod.Chip()
 
-class ChipClose(MockupTestCase):
+class ChipClose(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
@@ -135,7 +170,7 @@ class ChipClose(MockupTestCase):
         with self.assertRaises(ValueError):
             chip.name()
 
-class ChipInfo(MockupTestCase):
+class ChipInfo(SharedMockupTestCase):
 
     chip_sizes = ( 16, )
 
@@ -145,93 +180,93 @@ class ChipInfo(MockupTestCase):
         self.assertEqual(chip.label(), 'gpio-mockup-A')
         self.assertEqual(chip.num_lines(), 16)
 
-class ChipGetLines(MockupTestCase):
+class ChipGetLines(SharedMockupTestCase):
 
     chip_sizes = ( 8, 8, 4 )
     flags = gpiomockup.Mockup.FLAG_NAMED_LINES
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.chip = gpiod.Chip(mockup.chip_name(1))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.chip.close()
+        super().tearDownClass()
+
     def test_get_single_line_by_offset(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            line = chip.get_line(4)
-            self.assertEqual(line.name(), 'gpio-mockup-B-4')
+        line = self.chip.get_line(4)
+        self.assertEqual(line.name(), 'gpio-mockup-B-4')
 
     def test_find_single_line_by_name(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            line = chip.find_line('gpio-mockup-B-4')
-            self.assertEqual(line.offset(), 4)
+        line = self.chip.find_line('gpio-mockup-B-4')
+        self.assertEqual(line.offset(), 4)
 
     def test_get_single_line_invalid_offset(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            with self.assertRaises(OSError) as err_ctx:
-                line = chip.get_line(11)
+        with self.assertRaises(OSError) as err_ctx:
+            line = self.chip.get_line(11)
 
-            self.assertEqual(err_ctx.exception.errno, errno.EINVAL)
+        self.assertEqual(err_ctx.exception.errno, errno.EINVAL)
 
     def test_find_single_line_nonexistent(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            line = chip.find_line('nonexistent-line')
-            self.assertEqual(line, None)
+        line = self.chip.find_line('nonexistent-line')
+        self.assertEqual(line, None)
 
     def test_get_multiple_lines_by_offsets_in_tuple(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            lines = chip.get_lines(( 1, 3, 6, 7 )).to_list()
-            self.assertEqual(len(lines), 4)
-            self.assertEqual(lines[0].name(), 'gpio-mockup-B-1')
-            self.assertEqual(lines[1].name(), 'gpio-mockup-B-3')
-            self.assertEqual(lines[2].name(), 'gpio-mockup-B-6')
-            self.assertEqual(lines[3].name(), 'gpio-mockup-B-7')
+        lines = self.chip.get_lines(( 1, 3, 6, 7 ))
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0].name(), 'gpio-mockup-B-1')
+        self.assertEqual(lines[1].name(), 'gpio-mockup-B-3')
+        self.assertEqual(lines[2].name(), 'gpio-mockup-B-6')
+        self.assertEqual(lines[3].name(), 'gpio-mockup-B-7')
 
     def test_get_multiple_lines_by_offsets_in_list(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            lines = chip.get_lines([ 1, 3, 6, 7 ]).to_list()
-            self.assertEqual(len(lines), 4)
-            self.assertEqual(lines[0].name(), 'gpio-mockup-B-1')
-            self.assertEqual(lines[1].name(), 'gpio-mockup-B-3')
-            self.assertEqual(lines[2].name(), 'gpio-mockup-B-6')
-            self.assertEqual(lines[3].name(), 'gpio-mockup-B-7')
+        lines = self.chip.get_lines([ 1, 3, 6, 7 ])
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0].name(), 'gpio-mockup-B-1')
+        self.assertEqual(lines[1].name(), 'gpio-mockup-B-3')
+        self.assertEqual(lines[2].name(), 'gpio-mockup-B-6')
+        self.assertEqual(lines[3].name(), 'gpio-mockup-B-7')
 
     def test_find_multiple_lines_by_names_in_tuple(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            lines = chip.find_lines(( 'gpio-mockup-B-0',
-                                      'gpio-mockup-B-3',
-                                      'gpio-mockup-B-4',
-                                      'gpio-mockup-B-6' )).to_list()
-            self.assertEqual(len(lines), 4)
-            self.assertEqual(lines[0].offset(), 0)
-            self.assertEqual(lines[1].offset(), 3)
-            self.assertEqual(lines[2].offset(), 4)
-            self.assertEqual(lines[3].offset(), 6)
+        lines = self.chip.find_lines(( 'gpio-mockup-B-0',
+                                       'gpio-mockup-B-3',
+                                       'gpio-mockup-B-4',
+                                       'gpio-mockup-B-6' ))
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0].offset(), 0)
+        self.assertEqual(lines[1].offset(), 3)
+        self.assertEqual(lines[2].offset(), 4)
+        self.assertEqual(lines[3].offset(), 6)
 
     def test_find_multiple_lines_by_names_in_list(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            lines = chip.find_lines([ 'gpio-mockup-B-0',
-                                      'gpio-mockup-B-3',
-                                      'gpio-mockup-B-4',
-                                      'gpio-mockup-B-6' ]).to_list()
-            self.assertEqual(len(lines), 4)
-            self.assertEqual(lines[0].offset(), 0)
-            self.assertEqual(lines[1].offset(), 3)
-            self.assertEqual(lines[2].offset(), 4)
-            self.assertEqual(lines[3].offset(), 6)
+        lines = self.chip.find_lines([ 'gpio-mockup-B-0',
+                                       'gpio-mockup-B-3',
+                                       'gpio-mockup-B-4',
+                                       'gpio-mockup-B-6' ])
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0].offset(), 0)
+        self.assertEqual(lines[1].offset(), 3)
+        self.assertEqual(lines[2].offset(), 4)
+        self.assertEqual(lines[3].offset(), 6)
 
     def test_get_multiple_lines_invalid_offset(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            with self.assertRaises(OSError) as err_ctx:
-                line = chip.get_lines(( 1, 3, 11, 7 ))
+        with self.assertRaises(OSError) as err_ctx:
+            line = self.chip.get_lines(( 1, 3, 11, 7 ))
 
-            self.assertEqual(err_ctx.exception.errno, errno.EINVAL)
+        self.assertEqual(err_ctx.exception.errno, errno.EINVAL)
 
     def test_find_multiple_lines_nonexistent(self):
-        with gpiod.Chip(mockup.chip_name(1)) as chip:
-            with self.assertRaises(TypeError):
-                lines = chip.find_lines(( 'gpio-mockup-B-0',
-                                          'nonexistent-line',
-                                          'gpio-mockup-B-4',
-                                          'gpio-mockup-B-6' )).to_list()
+        with self.assertRaises(TypeError):
+            lines = self.chip.find_lines(( 'gpio-mockup-B-0',
+                                           'nonexistent-line',
+                                           'gpio-mockup-B-4',
+                                           'gpio-mockup-B-6' )).to_list()
 
     def test_get_all_lines(self):
         with gpiod.Chip(mockup.chip_name(2)) as chip:
-            lines = chip.get_all_lines().to_list()
+            lines = chip.get_all_lines()
             self.assertEqual(len(lines), 4)
             self.assertEqual(lines[0].name(), 'gpio-mockup-C-0')
             self.assertEqual(lines[1].name(), 'gpio-mockup-C-1')
@@ -242,7 +277,7 @@ class ChipGetLines(MockupTestCase):
 # Line test cases
 #
 
-class LineGlobalFindLine(MockupTestCase):
+class LineGlobalFindLine(SharedMockupTestCase):
 
     chip_sizes = ( 4, 8, 16 )
     flags = gpiomockup.Mockup.FLAG_NAMED_LINES
@@ -441,9 +476,7 @@ class LineValues(MockupTestCase):
             lines.request(consumer=default_consumer,
                           type=gpiod.LINE_REQ_DIR_IN)
             self.assertEqual(lines.get_values(), [ 0, 0, 0, 0 ])
-            mockup.chip_set_pull(0, 0, 1)
-            mockup.chip_set_pull(0, 4, 1)
-            mockup.chip_set_pull(0, 6, 1)
+            mockup.chip_set_pulls(0, ( 0, 4, 6 ), ( 1, 1, 1 ))
             self.assertEqual(lines.get_values(), [ 1, 0, 1, 1 ])
 
     def test_set_value_multiple_lines(self):
@@ -452,15 +485,11 @@ class LineValues(MockupTestCase):
             lines.request(consumer=default_consumer,
                           type=gpiod.LINE_REQ_DIR_OUT)
             lines.set_values(( 1, 0, 1, 1 ))
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 1)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 0, 1, 1 ])
             lines.set_values(( 0, 0, 1, 0 ))
-            self.assertEqual(mockup.chip_get_value(0, 0), 0)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 0, 0, 1, 0 ])
 
     def test_set_multiple_values_with_default_vals_argument(self):
         with gpiod.Chip(mockup.chip_name(0)) as chip:
@@ -468,10 +497,8 @@ class LineValues(MockupTestCase):
             lines.request(consumer=default_consumer,
                          type=gpiod.LINE_REQ_DIR_OUT,
                          default_vals=( 1, 0, 1, 1 ))
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 1)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 0, 1, 1 ])
 
     def test_get_value_active_low(self):
         with gpiod.Chip(mockup.chip_name(0)) as chip:
@@ -546,15 +573,11 @@ class LineConfig(MockupTestCase):
             lines.request(consumer=default_consumer,
                           type=gpiod.LINE_REQ_DIR_OUT,
                           default_vals=(1,1,1,1))
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 1)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 1)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 1, 1, 1 ])
             lines.set_config(gpiod.LINE_REQ_DIR_OUT,0)
-            self.assertEqual(mockup.chip_get_value(0, 0), 0)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 0)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 0, 0, 0, 0 ])
 
 class LineFlags(MockupTestCase):
 
@@ -578,20 +601,14 @@ class LineFlags(MockupTestCase):
             lines.request(consumer=default_consumer,
                           type=gpiod.LINE_REQ_DIR_OUT,
                           default_vals=(1,1,1,1))
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 1)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 1)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 1, 1, 1 ])
             lines.set_flags(gpiod.LINE_REQ_FLAG_ACTIVE_LOW)
-            self.assertEqual(mockup.chip_get_value(0, 0), 0)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 0)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 0, 0, 0, 0 ])
             lines.set_flags(0)
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 1)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 1)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 1, 1, 1 ])
 
 class LineDirection(MockupTestCase):
 
@@ -620,64 +637,28 @@ class LineDirection(MockupTestCase):
             lines = chip.get_lines(( 0, 3, 4, 6 ))
             lines.request(consumer=default_consumer,
                           type=gpiod.LINE_REQ_DIR_OUT)
-            self.assertEqual(lines.to_list()[0].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[1].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[2].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[3].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
+            self.assertEqual([ line.direction() for line in lines ],
+                             [ gpiod.Line.DIRECTION_OUTPUT ] * 4)
             lines.set_direction_input()
-            self.assertEqual(lines.to_list()[0].direction(),
-                             gpiod.Line.DIRECTION_INPUT)
-            self.assertEqual(lines.to_list()[1].direction(),
-                             gpiod.Line.DIRECTION_INPUT)
-            self.assertEqual(lines.to_list()[2].direction(),
-                             gpiod.Line.DIRECTION_INPUT)
-            self.assertEqual(lines.to_list()[3].direction(),
-                             gpiod.Line.DIRECTION_INPUT)
+            self.assertEqual([ line.direction() for line in lines ],
+                             [ gpiod.Line.DIRECTION_INPUT ] * 4)
             lines.set_direction_output((0,0,1,0))
-            self.assertEqual(lines.to_list()[0].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[1].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[2].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[3].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(mockup.chip_get_value(0, 0), 0)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual([ line.direction() for line in lines ],
+                             [ gpiod.Line.DIRECTION_OUTPUT ] * 4)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 0, 0, 1, 0 ])
             lines.set_direction_output((1,1,1,0))
-            self.assertEqual(lines.to_list()[0].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[1].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[2].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[3].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(mockup.chip_get_value(0, 0), 1)
-            self.assertEqual(mockup.chip_get_value(0, 3), 1)
-            self.assertEqual(mockup.chip_get_value(0, 4), 1)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual([ line.direction() for line in lines ],
+                             [ gpiod.Line.DIRECTION_OUTPUT ] * 4)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 1, 1, 1, 0 ])
             lines.set_direction_output()
-            self.assertEqual(lines.to_list()[0].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[1].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[2].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(lines.to_list()[3].direction(),
-                             gpiod.Line.DIRECTION_OUTPUT)
-            self.assertEqual(mockup.chip_get_value(0, 0), 0)
-            self.assertEqual(mockup.chip_get_value(0, 3), 0)
-            self.assertEqual(mockup.chip_get_value(0, 4), 0)
-            self.assertEqual(mockup.chip_get_value(0, 6), 0)
+            self.assertEqual([ line.direction() for line in lines ],
+                             [ gpiod.Line.DIRECTION_OUTPUT ] * 4)
+            self.assertEqual(mockup.chip_get_values(0, ( 0, 3, 4, 6 )),
+                             [ 0, 0, 0, 0 ])
 
-class LineRequestBehavior(MockupTestCase):
+class LineRequestBehavior(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
@@ -723,7 +704,7 @@ class LineRequestBehavior(MockupTestCase):
 # Iterator test cases
 #
 
-class ChipIterator(MockupTestCase):
+class ChipIterator(SharedMockupTestCase):
 
     chip_sizes = ( 4, 8, 16 )
 
@@ -744,7 +725,7 @@ class ChipIterator(MockupTestCase):
         self.assertTrue(gotB)
         self.assertTrue(gotC)
 
-class LineIterator(MockupTestCase):
+class LineIterator(SharedMockupTestCase):
 
     chip_sizes = ( 4, )
 
@@ -758,7 +739,7 @@ class LineIterator(MockupTestCase):
 
             self.assertEqual(count, chip.num_lines())
 
-class LineBulkIter(MockupTestCase):
+class LineBulkIter(SharedMockupTestCase):
 
     chip_sizes = ( 4, )
 
@@ -773,66 +754,76 @@ class LineBulkIter(MockupTestCase):
 
             self.assertEqual(count, chip.num_lines())
 
+    def test_line_bulk_indexing(self):
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            lines = chip.get_lines(( 1, 3 ))
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(lines[0].offset(), 1)
+            self.assertEqual(lines[1].offset(), 3)
+            self.assertEqual(lines[-1].offset(), 3)
+            with self.assertRaises(IndexError):
+                line = lines[2]
+
 #
 # Event test cases
 #
 
-class EventSingleLine(MockupTestCase):
+class EventSingleLine(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
-    def test_single_line_rising_edge_event(self):
-        with EventThread(0, 4, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                line = chip.get_line(4)
-                line.request(consumer=default_consumer,
-                             type=gpiod.LINE_REQ_EV_RISING_EDGE)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.RISING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
+    def test_single_line_single_edge_events(self):
+        edges = ( ( gpiod.LINE_REQ_EV_RISING_EDGE,
+                    gpiod.LineEvent.RISING_EDGE ),
+                  ( gpiod.LINE_REQ_EV_FALLING_EDGE,
+                    gpiod.LineEvent.FALLING_EDGE ) )
 
-    def test_single_line_falling_edge_event(self):
-        with EventThread(0, 4, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                line = chip.get_line(4)
-                line.request(consumer=default_consumer,
-                             type=gpiod.LINE_REQ_EV_FALLING_EDGE)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.FALLING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            line = chip.get_line(4)
+            for req_type, ev_type in edges:
+                with self.subTest(type=req_type):
+                    line.request(consumer=default_consumer, type=req_type)
+                    try:
+                        with EventThread(0, 4, 10):
+                            self.assertTrue(line.event_wait(sec=1))
+                            event = line.event_read()
+                            self.assertEqual(event.type, ev_type)
+                            self.assertEqual(event.source.offset(), 4)
+                    finally:
+                        line.release()
 
     def test_single_line_both_edges_events(self):
-        with EventThread(0, 4, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                line = chip.get_line(4)
-                line.request(consumer=default_consumer,
-                             type=gpiod.LINE_REQ_EV_BOTH_EDGES)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.RISING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.FALLING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            line = chip.get_line(4)
+            line.request(consumer=default_consumer,
+                         type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+            with EventThread(0, 4, 10):
+                events = []
+                while len(events) < 2:
+                    self.assertTrue(line.event_wait(sec=1))
+                    events += line.event_read_multiple()
+
+                self.assertEqual(events[0].type, gpiod.LineEvent.RISING_EDGE)
+                self.assertEqual(events[0].source.offset(), 4)
+                self.assertEqual(events[1].type, gpiod.LineEvent.FALLING_EDGE)
+                self.assertEqual(events[1].source.offset(), 4)
 
     def test_single_line_both_edges_events_active_low(self):
-        with EventThread(0, 4, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                line = chip.get_line(4)
-                line.request(consumer=default_consumer,
-                             type=gpiod.LINE_REQ_EV_BOTH_EDGES,
-                             flags=gpiod.LINE_REQ_FLAG_ACTIVE_LOW)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.FALLING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
-                self.assertTrue(line.event_wait(sec=1))
-                event = line.event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.RISING_EDGE)
-                self.assertEqual(event.source.offset(), 4)
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            line = chip.get_line(4)
+            line.request(consumer=default_consumer,
+                         type=gpiod.LINE_REQ_EV_BOTH_EDGES,
+                         flags=gpiod.LINE_REQ_FLAG_ACTIVE_LOW)
+            with EventThread(0, 4, 10):
+                events = []
+                while len(events) < 2:
+                    self.assertTrue(line.event_wait(sec=1))
+                    events += line.event_read_multiple()
+
+                self.assertEqual(events[0].type, gpiod.LineEvent.FALLING_EDGE)
+                self.assertEqual(events[0].source.offset(), 4)
+                self.assertEqual(events[1].type, gpiod.LineEvent.RISING_EDGE)
+                self.assertEqual(events[1].source.offset(), 4)
 
     def test_single_line_read_multiple_events(self):
         with gpiod.Chip(mockup.chip_name(0)) as chip:
@@ -844,9 +835,11 @@ class EventSingleLine(MockupTestCase):
             mockup.chip_set_pull(0, 4, 0)
             time.sleep(0.01)
             mockup.chip_set_pull(0, 4, 1)
-            time.sleep(0.01)
-            self.assertTrue(line.event_wait(sec=1))
-            events = line.event_read_multiple()
+            events = []
+            while len(events) < 3:
+                self.assertTrue(line.event_wait(sec=1))
+                events += line.event_read_multiple()
+
             self.assertEqual(len(events), 3)
             self.assertEqual(events[0].type, gpiod.LineEvent.RISING_EDGE)
             self.assertEqual(events[1].type, gpiod.LineEvent.FALLING_EDGE)
@@ -855,16 +848,16 @@ class EventSingleLine(MockupTestCase):
             self.assertEqual(events[1].source.offset(), 4)
             self.assertEqual(events[2].source.offset(), 4)
 
-class EventBulk(MockupTestCase):
+class EventBulk(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
     def test_watch_multiple_lines_for_events(self):
-        with EventThread(0, 2, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                lines = chip.get_lines(( 0, 1, 2, 3, 4 ))
-                lines.request(consumer=default_consumer,
-                              type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            lines = chip.get_lines(( 0, 1, 2, 3, 4 ))
+            lines.request(consumer=default_consumer,
+                          type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+            with EventThread(0, 2, 10):
                 event_lines = lines.event_wait(sec=1)
                 self.assertEqual(len(event_lines), 1)
                 line = event_lines[0]
@@ -878,7 +871,7 @@ class EventBulk(MockupTestCase):
                 self.assertEqual(event.type, gpiod.LineEvent.FALLING_EDGE)
                 self.assertEqual(event.source.offset(), 2)
 
-class EventValues(MockupTestCase):
+class EventValues(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
@@ -901,7 +894,7 @@ class EventValues(MockupTestCase):
             mockup.chip_set_pull(0, 3, 1)
             self.assertEqual(line.get_value(), 0)
 
-class EventFileDescriptor(MockupTestCase):
+class EventFileDescriptor(SharedMockupTestCase):
 
     chip_sizes = ( 8, )
 
@@ -932,23 +925,21 @@ class EventFileDescriptor(MockupTestCase):
             self.assertEqual(err_ctx.exception.errno, errno.EPERM)
 
     def test_event_fd_polling(self):
-        with EventThread(0, 2, 200):
-            with gpiod.Chip(mockup.chip_name(0)) as chip:
-                lines = chip.get_lines(( 0, 1, 2, 3, 4, 5, 6 ))
-                lines.request(consumer=default_consumer,
-                              type=gpiod.LINE_REQ_EV_BOTH_EDGES)
-
-                inputs = []
-                for line in lines:
-                    inputs.append(line.event_get_fd())
-
+        with gpiod.Chip(mockup.chip_name(0)) as chip:
+            lines = chip.get_lines(( 0, 1, 2, 3, 4, 5, 6 ))
+            lines.request(consumer=default_consumer,
+                          type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+            with EventThread(0, 2, 10):
+                inputs = [ line.event_get_fd() for line in lines ]
                 readable, writable, exceptional = select.select(inputs, [],
-                                                                inputs, 1.0)
-
-                self.assertEqual(len(readable), 1)
-                event = lines.to_list()[2].event_read()
-                self.assertEqual(event.type, gpiod.LineEvent.RISING_EDGE)
-                self.assertEqual(event.source.offset(), 2)
+                                                                [], 1.0)
+
+                self.assertEqual(readable, [ inputs[2] ])
+                events = lines[2].event_read_multiple()
+                self.assertGreaterEqual(len(events), 1)
+                self.assertEqual(events[0].type, gpiod.LineEvent.RISING_EDGE)
+                for event in events:
+                    self.assertEqual(event.source.offset(), 2)
 
 #
 # Main
@@ -7,6 +7,7 @@
 
 #include <Python.h>
 #include <gpio-mockup.h>
+#include <stdbool.h>
 
 typedef struct {
 	PyObject_HEAD
@@ -43,6 +44,88 @@ static void gpiomockup_Mockup_dealloc(gpiomockup_MockupObject *self)
 	PyObject_Del(self);
 }
 
+/*
+ * Convert a sequence of integers into a newly allocated C array of ints or
+ * unsigned ints, depending on is_signed. The array must be freed with
+ * PyMem_RawFree().
+ */
+static void *gpiomockup_ObjToArray(PyObject *obj, Py_ssize_t *num,
+				   bool is_signed)
+{
+	PyObject *iter, *next;
+	unsigned int *uarr;
+	Py_ssize_t i;
+	int *iarr;
+	void *arr;
+
+	*num = PyObject_Size(obj);
+	if (*num < 0)
+		return NULL;
+
+	/* Always allocate at least one element so that NULL means error. */
+	arr = PyMem_RawCalloc(*num ?: 1, sizeof(int));
+	if (!arr) {
+		PyErr_NoMemory();
+		return NULL;
+	}
+
+	iarr = arr;
+	uarr = arr;
+
+	iter = PyObject_GetIter(obj);
+	if (!iter) {
+		PyMem_RawFree(arr);
+		return NULL;
+	}
+
+	for (i = 0;; i++) {
+		next = PyIter_Next(iter);
+		if (!next)
+			break;
+
+		if (i >= *num) {
+			/* The sequence grew, make the size check below fail. */
+			Py_DECREF(next);
+			i++;
+			break;
+		}
+
+		if (is_signed)
+			iarr[i] = PyLong_AsLong(next);
+		else
+			uarr[i] = PyLong_AsUnsignedLong(next);
+		Py_DECREF(next);
+		if (PyErr_Occurred())
+			break;
+	}
+	Py_DECREF(iter);
+
+	if (PyErr_Occurred()) {
+		PyMem_RawFree(arr);
+		return NULL;
+	}
+
+	if (i != *num) {
+		PyMem_RawFree(arr);
+		PyErr_SetString(PyExc_RuntimeError,
+				"sequence changed size during iteration");
+		return NULL;
+	}
+
+	return arr;
+}
+
+static unsigned int *gpiomockup_ObjToUIntArray(PyObject *obj,
+						Py_ssize_t *num)
+{
+	return gpiomockup_ObjToArray(obj, num, false);
+}
+
+static int *gpiomockup_ObjToIntArray(PyObject *obj, Py_ssize_t *num)
+{
+	return gpiomockup_ObjToArray(obj, num, true);
+}
+
 static PyObject *gpiomockup_Mockup_probe(gpiomockup_MockupObject *self,
 					 PyObject *args, PyObject *kwds)
 {
@@ -50,51 +133,27 @@ static PyObject *gpiomockup_Mockup_probe(gpiomockup_MockupObject *self,
 				  "flags",
 				  NULL };
 
-	PyObject *chip_sizes_obj, *iter, *next;
+	PyObject *chip_sizes_obj;
 	unsigned int *chip_sizes;
-	int ret, flags = 0, i;
 	Py_ssize_t num_chips;
+	int ret, flags = 0;
 
 	ret = PyArg_ParseTupleAndKeywords(args, kwds, "O|i", kwlist,
 					  &chip_sizes_obj, &flags);
 	if (!ret)
 		return NULL;
 
-	num_chips = PyObject_Size(chip_sizes_obj);
-	if (num_chips < 0) {
-		return NULL;
-	} else if (num_chips == 0) {
-		PyErr_SetString(PyExc_TypeError,
-				"Number of chips must be greater thatn 0");
-		return NULL;
-	}
-
-	chip_sizes = PyMem_RawCalloc(num_chips, sizeof(unsigned int));
+	chip_sizes = gpiomockup_ObjToUIntArray(chip_sizes_obj, &num_chips);
 	if (!chip_sizes)
 		return NULL;
 
-	iter = PyObject_GetIter(chip_sizes_obj);
-	if (!iter) {
+	if (num_chips == 0) {
 		PyMem_RawFree(chip_sizes);
+		PyErr_SetString(PyExc_TypeError,
+				"Number of chips must be greater thatn 0");
 		return NULL;
 	}
 
-	for (i = 0;; i++) {
-		next = PyIter_Next(iter);
-		if (!next) {
-			Py_DECREF(iter);
-			break;
-		}
-
-		chip_sizes[i] = PyLong_AsUnsignedLong(next);
-		Py_DECREF(next);
-		if (PyErr_Occurred()) {
-			Py_DECREF(iter);
-			PyMem_RawFree(chip_sizes);
-			return NULL;
-		}
-	}
-
 	if (flags & gpiomockup_FLAG_NAMED_LINES)
 		flags |= GPIO_MOCKUP_FLAG_NAMED_LINES;
 
@@ -225,6 +284,118 @@ static PyObject *gpiomockup_Mockup_chip_set_pull(gpiomockup_MockupObject *self,
 	Py_RETURN_NONE;
 }
 
+static PyObject *gpiomockup_Mockup_chip_get_values(gpiomockup_MockupObject *self,
+						   PyObject *args)
+{
+	PyObject *offsets_obj, *values, *val;
+	unsigned int chip_idx, *offsets;
+	Py_ssize_t num_lines, i;
+	int ret, *vals;
+
+	ret = PyArg_ParseTuple(args, "IO", &chip_idx, &offsets_obj);
+	if (!ret)
+		return NULL;
+
+	offsets = gpiomockup_ObjToUIntArray(offsets_obj, &num_lines);
+	if (!offsets)
+		return NULL;
+
+	vals = PyMem_RawCalloc(num_lines ?: 1, sizeof(int));
+	if (!vals) {
+		PyMem_RawFree(offsets);
+		return PyErr_NoMemory();
+	}
+
+	Py_BEGIN_ALLOW_THREADS;
+	for (i = 0; i < num_lines; i++) {
+		vals[i] = gpio_mockup_get_value(self->mockup,
+						chip_idx, offsets[i]);
+		if (vals[i] < 0)
+			break;
+	}
+	Py_END_ALLOW_THREADS;
+	if (i < num_lines) {
+		PyErr_SetFromErrno(PyExc_OSError);
+		PyMem_RawFree(offsets);
+		PyMem_RawFree(vals);
+		return NULL;
+	}
+
+	PyMem_RawFree(offsets);
+
+	values = PyList_New(num_lines);
+	if (!values) {
+		PyMem_RawFree(vals);
+		return NULL;
+	}
+
+	for (i = 0; i < num_lines; i++) {
+		val = PyLong_FromLong(vals[i]);
+		if (!val) {
+			Py_DECREF(values);
+			PyMem_RawFree(vals);
+			return NULL;
+		}
+
+		PyList_SET_ITEM(values, i, val);
+	}
+
+	PyMem_RawFree(vals);
+	return values;
+}
+
+static PyObject *gpiomockup_Mockup_chip_set_pulls(gpiomockup_MockupObject *self,
+						  PyObject *args)
+{
+	unsigned int chip_idx, *offsets;
+	PyObject *offsets_obj, *pulls_obj;
+	int *pulls;
+	Py_ssize_t num_lines, num_pulls, i;
+	int ret;
+
+	ret = PyArg_ParseTuple(args, "IOO", &chip_idx,
+			       &offsets_obj, &pulls_obj);
+	if (!ret)
+		return NULL;
+
+	offsets = gpiomockup_ObjToUIntArray(offsets_obj, &num_lines);
+	if (!offsets)
+		return NULL;
+
+	pulls = gpiomockup_ObjToIntArray(pulls_obj, &num_pulls);
+	if (!pulls) {
+		PyMem_RawFree(offsets);
+		return NULL;
+	}
+
+	if (num_lines != num_pulls) {
+		PyMem_RawFree(offsets);
+		PyMem_RawFree(pulls);
+		PyErr_SetString(PyExc_ValueError,
+				"Number of offsets and pull values must be equal");
+		return NULL;
+	}
+
+	ret = 0;
+	Py_BEGIN_ALLOW_THREADS;
+	for (i = 0; i < num_lines; i++) {
+		ret = gpio_mockup_set_pull(self->mockup, chip_idx,
+					   offsets[i], pulls[i]);
+		if (ret)
+			break;
+	}
+	Py_END_ALLOW_THREADS;
+	if (ret)
+		PyErr_SetFromErrno(PyExc_OSError);
+
+	PyMem_RawFree(offsets);
+	PyMem_RawFree(pulls);
+	if (ret)
+		return NULL;
+
+	Py_RETURN_NONE;
+}
+
 static PyMethodDef gpiomockup_Mockup_methods[] = {
 	{
 		.ml_name = "probe",
@@ -261,6 +432,16 @@ static PyMethodDef gpiomockup_Mockup_methods[] = {
 		.ml_meth = (PyCFunction)gpiomockup_Mockup_chip_set_pull,
 		.ml_flags = METH_VARARGS,
 	},
+	{
+		.ml_name = "chip_get_values",
+		.ml_meth = (PyCFunction)gpiomockup_Mockup_chip_get_values,
+		.ml_flags = METH_VARARGS,
+	},
+	{
+		.ml_name = "chip_set_pulls",
+		.ml_meth = (PyCFunction)gpiomockup_Mockup_chip_set_pulls,
+		.ml_flags = METH_VARARGS,
+	},
 	{ }
 };
 